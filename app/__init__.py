@@ -3,7 +3,7 @@ Absolute Humidity Calculator application package.
 
 Modules:
     - models: Pydantic models for request/response validation
-    - psychro_calculations: PsychroLib-based calculation logic
+    - psychro_calculations: ASHRAE psychrometric calculation kernels
     - config: Application configuration settings
     - routes: API and web route handlers
 """
@@ -12,18 +12,23 @@ from .config import config
 from .models import (
     ErrorResponse,
     HealthResponse,
+    HumidityBatchRequest,
+    HumidityBatchResponse,
     HumidityCalculationRequest,
     HumidityCalculationResponse,
 )
-from .psychro_calculations import calculate_absolute_humidity
+from .psychro_calculations import calculate_absolute_humidity, calculate_absolute_humidity_batch
 
 __version__ = "0.2.0"
 
 __all__ = [
     "calculate_absolute_humidity",
+    "calculate_absolute_humidity_batch",
     "config",
     "HumidityCalculationRequest",
     "HumidityCalculationResponse",
+    "HumidityBatchRequest",
+    "HumidityBatchResponse",
     "HealthResponse",
     "ErrorResponse",
 ]
@@ -2,62 +2,103 @@
 Configuration settings for the Absolute Humidity Calculator application.
 """
 
+import importlib.util
+import logging
+import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
 
+logger = logging.getLogger(__name__)
 
+# uvloop and httptools come with uvicorn[standard] but have no wheels for every platform
+HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+HAS_HTTPTOOLS = importlib.util.find_spec("httptools") is not None
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration."""
+    """
+    Application configuration.
+
+    A frozen, slotted dataclass: settings are fixed for the life of the
+    process, and slot access is cheaper than a class attribute lookup on
+    the hot request path.
+    """
 
     # Application metadata
-    APP_NAME = "Absolute Humidity Calculator"
-    APP_VERSION = "0.2.0"
-    APP_DESCRIPTION = "Calculate absolute humidity from temperature and relative humidity."
+    APP_NAME: str = "Absolute Humidity Calculator"
+    APP_VERSION: str = "0.2.0"
+    APP_DESCRIPTION: str = "Calculate absolute humidity from temperature and relative humidity."
 
     # Server settings
-    HOST = "0.0.0.0"
-    PORT = 8000
-    RELOAD = True
-    LOG_LEVEL = "info"
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    RELOAD: bool = True
+    LOG_LEVEL: str = "info"
+    WORKERS: int = os.cpu_count() or 1  # Ignored by uvicorn while RELOAD is on
+    LOOP: str = "uvloop" if HAS_UVLOOP else "asyncio"
+    HTTP: str = "httptools" if HAS_HTTPTOOLS else "h11"
 
     # API / docs URLs
-    API_PREFIX = "/api"
-    DOCS_URL = "/docs"
-    OPENAPI_URL = "/openapi.json"
+    API_PREFIX: str = "/api"
+    DOCS_URL: str = "/docs"
+    OPENAPI_URL: str = "/openapi.json"
 
     # File paths
-    BASE_DIR = Path(__file__).parent.parent
-    TEMPLATES_DIR = BASE_DIR / "templates"
-    STATIC_DIR = BASE_DIR / "static"
+    BASE_DIR: Path = Path(__file__).parent.parent
+    TEMPLATES_DIR: Path = BASE_DIR / "templates"
+    STATIC_DIR: Path = BASE_DIR / "static"
+    STATIC_DIR_EXISTS: bool = STATIC_DIR.is_dir()  # Checked once, at import
+
+    # Browser cache lifetime for the HTML pages, in seconds (revalidated by ETag afterwards)
+    PAGE_CACHE_MAX_AGE: int = 3600
 
     # Response formatting
-    DEFAULT_UNIT = "g/m³"
+    DEFAULT_UNIT: str = "g/m³"
+
+    # Maximum number of readings accepted by the batch endpoint
+    BATCH_MAX_SIZE: int = 10_000
+    # Batches at least this large are computed off the event loop (~100 µs of work)
+    BATCH_THREADPOOL_THRESHOLD: int = 1_000
+
+    # Serialized /calculate responses cached by request body; larger bodies bypass the cache
+    RESPONSE_CACHE_SIZE: int = 4096
+    RESPONSE_CACHE_MAX_BODY: int = 256
+
+    # Response compression (level 1 keeps CPU cost low; numeric JSON still compresses well)
+    GZIP_MINIMUM_SIZE: int = 500
+    GZIP_COMPRESS_LEVEL: int = 1
 
     # CORS
-    ALLOW_ORIGINS = ["*"]
-    ALLOW_METHODS = ["GET", "POST"]
-    ALLOW_HEADERS = ["*"]
+    ALLOW_ORIGINS: tuple[str, ...] = ("*",)
+    ALLOW_METHODS: tuple[str, ...] = ("GET", "POST")
+    ALLOW_HEADERS: tuple[str, ...] = ("*",)
 
-    @classmethod
-    def get_uvicorn_config(cls) -> Dict[str, Any]:
+    def get_uvicorn_config(self) -> Dict[str, Any]:
         """Get configuration for the uvicorn server."""
+        if not (HAS_UVLOOP and HAS_HTTPTOOLS):
+            logger.warning("uvloop/httptools not installed; falling back to the slower asyncio loop and h11 parser")
         return {
-            "host": cls.HOST,
-            "port": cls.PORT,
-            "reload": cls.RELOAD,
-            "log_level": cls.LOG_LEVEL,
+            "host": self.HOST,
+            "port": self.PORT,
+            "reload": self.RELOAD,
+            "workers": 1 if self.RELOAD else self.WORKERS,
+            "log_level": self.LOG_LEVEL,
+            "loop": self.LOOP,
+            "http": self.HTTP,
+            "interface": "asgi3",
         }
 
-    @classmethod
-    def get_fastapi_config(cls) -> Dict[str, Any]:
+    def get_fastapi_config(self) -> Dict[str, Any]:
         """Get configuration for FastAPI app initialization."""
         return {
-            "title": cls.APP_NAME,
-            "description": cls.APP_DESCRIPTION,
-            "version": cls.APP_VERSION,
-            "docs_url": cls.DOCS_URL,
+            "title": self.APP_NAME,
+            "description": self.APP_DESCRIPTION,
+            "version": self.APP_VERSION,
+            "docs_url": self.DOCS_URL,
             "redoc_url": None,  # ReDoc disabled; Swagger UI at /docs covers the same schema
-            "openapi_url": cls.OPENAPI_URL,
+            "openapi_url": self.OPENAPI_URL,
         }
 
 
@@ -2,14 +2,21 @@
 Pydantic models for request and response validation.
 """
 
-from pydantic import BaseModel, Field
+from typing import Annotated
+
+from pydantic import BaseModel, Field, model_validator
+
+from .config import config
+
+Temperature = Annotated[float, Field(ge=-100, le=100)]
+Humidity = Annotated[int, Field(ge=0, le=100)]
 
 
 class HumidityCalculationRequest(BaseModel):
     """Request model for humidity calculation."""
 
-    temperature: float = Field(..., ge=-100, le=100, description="Temperature in Celsius")
-    humidity: int = Field(..., ge=0, le=100, description="Relative humidity percentage (0-100)")
+    temperature: Annotated[Temperature, Field(description="Temperature in Celsius")]
+    humidity: Annotated[Humidity, Field(description="Relative humidity percentage (0-100)")]
 
 
 class HumidityCalculationResponse(BaseModel):
@@ -21,6 +28,31 @@ class HumidityCalculationResponse(BaseModel):
     unit: str = Field(default="g/m³", description="Unit of measurement")
 
 
+class HumidityBatchRequest(BaseModel):
+    """Request model for batch humidity calculation."""
+
+    temperature: list[Temperature] = Field(
+        ..., min_length=1, max_length=config.BATCH_MAX_SIZE, description="Temperatures in Celsius"
+    )
+    humidity: list[Humidity] = Field(
+        ..., min_length=1, max_length=config.BATCH_MAX_SIZE, description="Relative humidity percentages (0-100)"
+    )
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> "HumidityBatchRequest":
+        """Ensure every temperature has a matching humidity."""
+        if len(self.temperature) != len(self.humidity):
+            raise ValueError("temperature and humidity must have the same length")
+        return self
+
+
+class HumidityBatchResponse(BaseModel):
+    """Response model for batch humidity calculation."""
+
+    absolute_humidity: list[float] = Field(..., description="Absolute humidities in g/m³, in input order")
+    unit: str = Field(default="g/m³", description="Unit of measurement")
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
 
@@ -1,22 +1,194 @@
 """
-Psychrometric calculations using PsychroLib.
+Psychrometric calculations.
 
-This module provides a function to calculate absolute humidity
-using the PsychroLib package, which implements the formulas from
-the ASHRAE Handbook of Fundamentals.
+This module computes absolute humidity with a closed-form kernel that inlines
+the ASHRAE Handbook of Fundamentals formulas used by PsychroLib (saturation
+vapor pressure, humidity ratio and moist air density). When numba is installed
+the kernel is JIT-compiled to machine code, and compiled into a NumPy ufunc for
+batch calculations; otherwise it runs as plain Python and batches use a
+NumPy-vectorized copy of the same formulas.
 """
 
-import psychrolib
+import math
+from functools import lru_cache
 
-# Set unit system to SI (metric)
-psychrolib.SetUnitSystem(psychrolib.SI)
+import numpy as np
+
+try:
+    from numba import njit, vectorize
+except ImportError:  # numba is optional (see the "jit" extra)
+    vectorize = None
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed."""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# Standard atmospheric pressure in Pa
+STANDARD_PRESSURE = 101325.0
+
+# Constants from PsychroLib (SI units)
+_R_DA = 287.042  # Universal gas constant for dry air, J/kg/K
+_ZERO_CELSIUS_AS_KELVIN = 273.15
+_TRIPLE_POINT_WATER = 0.01  # °C
+_MIN_HUM_RATIO = 1e-7  # kg water / kg dry air
+
+# The kernels are specialized for standard pressure; fold its constant factors
+# (and the kg -> g conversion) into one coefficient
+_AH_COEFF = STANDARD_PRESSURE / _R_DA * 1000.0
+
+
+# Saturation vapor pressure fits for the common ambient range, used instead of
+# the log/exp ASHRAE formulas when numba is installed. Degree-10 Chebyshev fits
+# (numpy chebfit against PsychroLib's GetSatVapPres at 4001 points per segment,
+# converted to the power basis) in x = (T - mid) / half_width, separately over
+# ice and liquid water.
+# The largest error is about 1e-9 relative (under 1e-6 Pa).
+_PWS_FIT_T_MIN = -40.0  # °C
+_PWS_FIT_T_MAX = 60.0  # °C
+_PWS_ICE_MID = (_PWS_FIT_T_MIN + _TRIPLE_POINT_WATER) / 2
+_PWS_ICE_HALF_WIDTH = (_TRIPLE_POINT_WATER - _PWS_FIT_T_MIN) / 2
+_PWS_WATER_MID = (_TRIPLE_POINT_WATER + _PWS_FIT_T_MAX) / 2
+_PWS_WATER_HALF_WIDTH = (_PWS_FIT_T_MAX - _TRIPLE_POINT_WATER) / 2
+_PWS_ICE_COEFFS = (
+    103.30993815668018,
+    198.33150997400688,
+    174.6476961332709,
+    92.84628709723657,
+    32.920736542301405,
+    8.080115457955948,
+    1.365154709357121,
+    0.14827611186668985,
+    0.007675402518509356,
+    -0.00030109524852016585,
+    -6.409716402988801e-05,
+)
+_PWS_WATER_COEFFS = (
+    4247.249112407209,
+    7312.9063402942775,
+    5473.426699276578,
+    2283.580561268624,
+    555.7941273160307,
+    70.25647424861296,
+    1.2604014703682003,
+    -0.7013962193584569,
+    -0.021620116850483463,
+    0.009817705074056833,
+    0.0001043595611315176,
+)
+
+
+@njit(cache=True, fastmath=True)
+def _horner(coeffs, x):
+    """Evaluate a power-basis polynomial (lowest degree first) at x."""
+    result = coeffs[-1]
+    for i in range(len(coeffs) - 2, -1, -1):
+        result = result * x + coeffs[i]
+    return result
+
+
+@njit("float64(float64)", cache=True, fastmath=True)
+def _sat_vap_pres_exact(temperature_celsius):
+    """Return saturation vapor pressure in Pa over ice (ASHRAE eqn 5) or liquid water (eqn 6)."""
+    t = temperature_celsius + _ZERO_CELSIUS_AS_KELVIN
+    if temperature_celsius <= _TRIPLE_POINT_WATER:
+        ln_pws = (
+            -5.6745359e03 / t
+            + 6.3925247
+            - 9.677843e-03 * t
+            + 6.2215701e-07 * t * t
+            + 2.0747825e-09 * t * t * t
+            - 9.484024e-13 * t * t * t * t
+            + 4.1635019 * math.log(t)
+        )
+    else:
+        ln_pws = (
+            -5.8002206e03 / t
+            + 1.3914993
+            - 4.8640239e-02 * t
+            + 4.1764768e-05 * t * t
+            - 1.4452093e-08 * t * t * t
+            + 6.5459673 * math.log(t)
+        )
+    return math.exp(ln_pws)
+
+
+# The polynomial fits only pay off when compiled: run by the interpreter,
+# _horner's loop is about 2.6x slower than the log/exp formulas
+if vectorize is not None:
+
+    @njit("float64(float64)", cache=True, fastmath=True)
+    def _sat_vap_pres(temperature_celsius):
+        """Return saturation vapor pressure in Pa, from the fits inside their range."""
+        if _PWS_FIT_T_MIN <= temperature_celsius <= _TRIPLE_POINT_WATER:
+            return _horner(_PWS_ICE_COEFFS, (temperature_celsius - _PWS_ICE_MID) / _PWS_ICE_HALF_WIDTH)
+        if _TRIPLE_POINT_WATER < temperature_celsius <= _PWS_FIT_T_MAX:
+            return _horner(_PWS_WATER_COEFFS, (temperature_celsius - _PWS_WATER_MID) / _PWS_WATER_HALF_WIDTH)
+        return _sat_vap_pres_exact(temperature_celsius)
+
+else:
+    _sat_vap_pres = _sat_vap_pres_exact
+
+
+def _ah_kernel_py(temperature_celsius, rh_fraction):
+    """Return absolute humidity in g/m³ at standard pressure (ASHRAE eqns 5, 6, 11, 20, 26)."""
+    t = temperature_celsius + _ZERO_CELSIUS_AS_KELVIN
+
+    # Humidity ratio (kg water / kg dry air)
+    vap_pres = rh_fraction * _sat_vap_pres(temperature_celsius)
+    hum_ratio = max(0.621945 * vap_pres / (STANDARD_PRESSURE - vap_pres), _MIN_HUM_RATIO)
+
+    # Moist air density (kg/m³) times humidity ratio, in g/m³
+    return _AH_COEFF * (1.0 + hum_ratio) * hum_ratio / (t * (1.0 + 1.607858 * hum_ratio))
+
+
+# Explicit signatures compile eagerly (or load from the on-disk cache) at import,
+# and integer arguments are converted instead of triggering a new compilation
+_ah_kernel = njit("float64(float64, float64)", cache=True, fastmath=True)(_ah_kernel_py)
+
+
+def _ah_vec(temperature_celsius: np.ndarray, rh_fraction: np.ndarray) -> np.ndarray:
+    """Vectorized counterpart of `_ah_kernel` operating on float64 arrays."""
+    t = temperature_celsius + _ZERO_CELSIUS_AS_KELVIN
+    log_t = np.log(t)
+
+    # Polynomial terms in Horner form: avoids the slow array ** calls
+    ln_pws = np.where(
+        temperature_celsius <= _TRIPLE_POINT_WATER,
+        -5.6745359e03 / t
+        + (6.3925247 + t * (-9.677843e-03 + t * (6.2215701e-07 + t * (2.0747825e-09 - 9.484024e-13 * t))))
+        + 4.1635019 * log_t,
+        -5.8002206e03 / t
+        + (1.3914993 + t * (-4.8640239e-02 + t * (4.1764768e-05 - 1.4452093e-08 * t)))
+        + 6.5459673 * log_t,
+    )
+
+    vap_pres = rh_fraction * np.exp(ln_pws)
+    hum_ratio = np.maximum(0.621945 * vap_pres / (STANDARD_PRESSURE - vap_pres), _MIN_HUM_RATIO)
+
+    return _AH_COEFF * (1.0 + hum_ratio) * hum_ratio / (t * (1.0 + 1.607858 * hum_ratio))
+
+
+# Batch kernel: the scalar kernel compiled to a ufunc (a single pass with no
+# temporary arrays) when numba is available, the NumPy expression otherwise
+if vectorize is not None:
+    _ah_batch_kernel = vectorize(cache=True, fastmath=True)(_ah_kernel_py)
+else:
+    _ah_batch_kernel = _ah_vec
 
 
 def calculate_absolute_humidity(temperature_celsius: float, relative_humidity_percent: int) -> float:
     """
     Calculate absolute humidity given temperature and relative humidity.
 
-    Uses PsychroLib to calculate humidity ratio and then converts to absolute humidity.
+    Computes the humidity ratio and moist air density at standard atmospheric
+    pressure and returns their product as absolute humidity. Results are
+    cached per temperature and humidity, since sensors tend to report the
+    same readings over and over.
 
     Args:
         temperature_celsius (float): Temperature in Celsius
@@ -26,33 +198,89 @@ def calculate_absolute_humidity(temperature_celsius: float, relative_humidity_pe
         float: Absolute humidity in g/m³, rounded to 2 decimal places
 
     Raises:
-        ValueError: If the calculation fails
+        ValueError: If the inputs are outside the supported range
     """
-    try:
-        # Convert relative humidity from percentage to decimal
-        rh_decimal = relative_humidity_percent / 100.0
+    # A single chained comparison per input; it also rejects NaN, which compares False
+    temperature = float(temperature_celsius)
+    if not -100 <= temperature <= 200:
+        raise ValueError("Dry bulb temperature must be in range [-100, 200]°C")
+    if not 0 <= relative_humidity_percent <= 100:
+        raise ValueError("Relative humidity is outside range [0, 100]")
 
-        # Get humidity ratio (kg water / kg dry air)
-        humidity_ratio = psychrolib.GetHumRatioFromRelHum(
-            temperature_celsius,
-            rh_decimal,
-            101325,  # Standard atmospheric pressure in Pa
-        )
+    return _cached_absolute_humidity(temperature, relative_humidity_percent)
+
+
+def calculate_absolute_humidity_unchecked(temperature_celsius: float, relative_humidity_percent: int) -> float:
+    """
+    Calculate absolute humidity without range checks.
+
+    For callers whose inputs are already validated, such as the API handlers
+    (HumidityCalculationRequest enforces a stricter range than the kernel
+    supports).
+    """
+    return _cached_absolute_humidity(temperature_celsius, relative_humidity_percent)
+
+
+@lru_cache(maxsize=8192)
+def _cached_absolute_humidity(temperature_celsius: float, relative_humidity_percent: int) -> float:
+    """
+    Memoized kernel call keyed on the exact temperature and humidity.
+
+    The key is not rounded: the result must be computed at the input
+    temperature to match the batch path. Rounding the result happens here,
+    so it is paid once per distinct reading rather than on every request.
+    """
+    return round(_ah_kernel(temperature_celsius, relative_humidity_percent / 100.0), 2)
+
+
+def warm_up() -> None:
+    """
+    Compile the batch kernel and fill the result cache.
+
+    The batch ufunc compiles on first call (or loads machine code cached on
+    disk by an earlier run), so the app calls this at startup to keep that
+    work off the first request.
+    """
+    calculate_absolute_humidity_batch(np.array([20.0]), np.array([50]))
+    prewarm_cache()
+
+
+def prewarm_cache(min_temperature: int = 10, max_temperature: int = 35) -> None:
+    """
+    Fill the result cache with common ambient readings.
+
+    Computes every whole-degree temperature between the given bounds at every
+    whole humidity percentage, so typical indoor/outdoor readings are served
+    from the cache from the first request on.
+    """
+    for temperature in range(min_temperature, max_temperature + 1):
+        for humidity in range(101):
+            _cached_absolute_humidity(float(temperature), humidity)
+
+
+def calculate_absolute_humidity_batch(temperatures_celsius, relative_humidities_percent) -> np.ndarray:
+    """
+    Calculate absolute humidity for many temperature/humidity pairs at once.
+
+    Args:
+        temperatures_celsius (array-like): Temperatures in Celsius
+        relative_humidities_percent (array-like): Relative humidities as percentages (0-100)
+
+    Returns:
+        np.ndarray: Absolute humidities in g/m³, rounded to 2 decimal places
+
+    Raises:
+        ValueError: If the inputs differ in length or are outside the supported range
+    """
+    temperatures = np.asarray(temperatures_celsius, dtype=np.float64)
+    humidities = np.asarray(relative_humidities_percent, dtype=np.float64)
+
+    if temperatures.shape != humidities.shape:
+        raise ValueError("Temperature and humidity inputs must have the same length")
+    if not np.all((temperatures >= -100) & (temperatures <= 200)):
+        raise ValueError("Dry bulb temperature must be in range [-100, 200]°C")
+    if not np.all((humidities >= 0) & (humidities <= 100)):
+        raise ValueError("Relative humidity is outside range [0, 100]")
 
-        # Convert humidity ratio to absolute humidity (g/m³)
-        absolute_humidity = (
-            psychrolib.GetMoistAirDensity(
-                temperature_celsius,
-                humidity_ratio,
-                101325,  # Standard atmospheric pressure in Pa
-            )
-            * humidity_ratio
-            * 1000
-        )  # Convert from kg/m³ to g/m³
-
-        return round(absolute_humidity, 2)
-
-    except ValueError:
-        raise
-    except Exception as e:
-        raise ValueError(f"Calculation failed: {e}")
+    absolute_humidity = _ah_batch_kernel(temperatures, humidities / 100.0)
+    return np.round(absolute_humidity, 2, out=absolute_humidity)
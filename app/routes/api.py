@@ -1,19 +1,45 @@
 """
 API routes for the Absolute Humidity Calculator.
 
-This module contains the core API endpoint for calculating absolute humidity.
+This module contains the core API endpoints for calculating absolute humidity,
+for single readings and for batches.
 """
 
-from fastapi import APIRouter
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import to_json
 
 from ..config import config
 from ..models import (
     ErrorResponse,
     HealthResponse,
+    HumidityBatchRequest,
+    HumidityBatchResponse,
     HumidityCalculationRequest,
     HumidityCalculationResponse,
 )
-from ..psychro_calculations import calculate_absolute_humidity
+from ..psychro_calculations import calculate_absolute_humidity_batch, calculate_absolute_humidity_unchecked
+
+# Constants read on every request
+_UNIT = config.DEFAULT_UNIT
+_BATCH_THREADPOOL_THRESHOLD = config.BATCH_THREADPOOL_THRESHOLD
+_RESPONSE_CACHE_MAX_BODY = config.RESPONSE_CACHE_MAX_BODY
+
+# Request body validators, built once. pydantic-core parses and validates the
+# raw JSON in one pass, which beats json.loads followed by checks in Python
+_CALCULATION_REQUEST = TypeAdapter(HumidityCalculationRequest)
+_BATCH_REQUEST = TypeAdapter(HumidityBatchRequest)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# The health payload never changes, so serialize it once; probes must not see cached copies
+_HEALTH_BODY = HealthResponse(status="healthy").model_dump_json().encode()
+_HEALTH_HEADERS = {"Cache-Control": "no-cache"}
 
 # Create API router
 router = APIRouter(
@@ -27,14 +53,85 @@ router = APIRouter(
 )
 
 
+def _json_response(content: dict[str, Any]) -> Response:
+    """
+    Serialize a response payload straight to JSON bytes.
+
+    The payload is a plain dict shaped like the route's response_model and
+    is encoded by pydantic-core's serializer, skipping model construction.
+    Returning a Response makes FastAPI skip its own response_model
+    validation and encoding; the decorator's response_model still
+    documents the schema in OpenAPI.
+    """
+    return Response(content=to_json(content), media_type="application/json")
+
+
+async def _parse_body(request: Request, adapter: TypeAdapter[ModelT]) -> ModelT:
+    """
+    Parse and validate a JSON request body in one step.
+
+    `validate_json` feeds the raw bytes to pydantic-core's JSON parser instead
+    of decoding to a dict first. Errors are raised as RequestValidationError
+    so they get FastAPI's usual 422 response.
+    """
+    return _validate_body(await _read_json_body(request), adapter)
+
+
+async def _read_json_body(request: Request) -> bytes:
+    """
+    Read the raw body of a request that declares a JSON content type.
+
+    Mirrors FastAPI's own body handling: only application/json and
+    application/*+json bodies are parsed as JSON, and anything else
+    (including a missing content type) is rejected with a 422. This keeps
+    text/plain "simple" CORS requests from being accepted without preflight.
+    """
+    body = await request.body()
+    media_type = request.headers.get("content-type", "").partition(";")[0].strip().lower()
+    if media_type != "application/json" and not (
+        media_type.startswith("application/") and media_type.endswith("+json")
+    ):
+        raise RequestValidationError(
+            [
+                {
+                    "type": "model_attributes_type",
+                    "loc": ("body",),
+                    "msg": "Input should be a valid dictionary or object to extract fields from",
+                    "input": body,
+                }
+            ],
+            body=body,
+        )
+    return body
+
+
+def _validate_body(body: bytes, adapter: TypeAdapter[ModelT]) -> ModelT:
+    """Validate raw JSON bytes, raising RequestValidationError on failure."""
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as exc:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        raise RequestValidationError(errors, body=body) from None
+
+
+def _request_body_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """OpenAPI requestBody for handlers that read the body themselves."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
 @router.post(
     "/calculate",
     response_model=HumidityCalculationResponse,
     summary="Calculate Absolute Humidity",
     description=(
         "Calculate absolute humidity given temperature in Celsius and "
-        "relative humidity percentage. Uses PsychroLib for accurate "
-        "psychrometric calculations based on ASHRAE standards."
+        "relative humidity percentage, using the ASHRAE Handbook of "
+        "Fundamentals psychrometric equations at standard pressure."
     ),
     responses={
         200: {
@@ -50,25 +147,90 @@ router = APIRouter(
             "model": ErrorResponse,
         },
     },
+    openapi_extra=_request_body_schema(HumidityCalculationRequest),
 )
-async def calculate_humidity(request: HumidityCalculationRequest):
+async def calculate_humidity(request: Request):
     """
     Calculate absolute humidity from temperature and relative humidity.
 
-    Uses PsychroLib's psychrometric functions, which implement the ASHRAE
-    Handbook of Fundamentals formulas. A failed calculation raises ValueError,
-    which the app translates into a 400 response.
+    Uses the ASHRAE Handbook of Fundamentals formulas implemented by
+    PsychroLib. Inputs are validated once, by the request model, so the
+    calculation skips its own range checks, and the response is serialized
+    directly without being revalidated.
+
+    Repeated request bodies (sensors polling with the same reading) are
+    answered from a cache of serialized responses, skipping validation,
+    calculation and serialization altogether.
+
+    The handler stays async: the calculation takes about a microsecond, far
+    less than a threadpool round-trip would add.
     """
-    abs_humidity = calculate_absolute_humidity(request.temperature, request.humidity)
+    body = await _read_json_body(request)
+    if len(body) <= _RESPONSE_CACHE_MAX_BODY:
+        content = _cached_calculation_response(body)
+    else:
+        content = _calculation_response(body)
+    return Response(content=content, media_type="application/json")
 
-    return HumidityCalculationResponse(
-        absolute_humidity=abs_humidity,
-        temperature=request.temperature,
-        humidity=request.humidity,
-        unit=config.DEFAULT_UNIT,
+
+def _calculation_response(body: bytes) -> bytes:
+    """Validate a /calculate request body and return the serialized response."""
+    data = _validate_body(body, _CALCULATION_REQUEST)
+    abs_humidity = calculate_absolute_humidity_unchecked(data.temperature, data.humidity)
+
+    return to_json(
+        {
+            "absolute_humidity": abs_humidity,
+            "temperature": data.temperature,
+            "humidity": data.humidity,
+            "unit": _UNIT,
+        }
     )
 
 
+# Keyed on the raw body bytes; invalid bodies raise and are never cached
+_cached_calculation_response = lru_cache(maxsize=config.RESPONSE_CACHE_SIZE)(_calculation_response)
+
+
+@router.post(
+    "/calculate_batch",
+    response_model=HumidityBatchResponse,
+    summary="Calculate Absolute Humidity (Batch)",
+    description=(
+        "Calculate absolute humidity for many readings in one request. "
+        "Takes parallel lists of temperatures in Celsius and relative "
+        "humidity percentages and returns results in the same order."
+    ),
+    responses={
+        200: {
+            "description": "Successful calculation",
+            "model": HumidityBatchResponse,
+        },
+        422: {
+            "description": "Validation error - invalid input parameters",
+            "model": ErrorResponse,
+        },
+    },
+    openapi_extra=_request_body_schema(HumidityBatchRequest),
+)
+async def calculate_humidity_batch(request: Request):
+    """
+    Calculate absolute humidity for a batch of readings.
+
+    All readings are computed in a single NumPy-vectorized pass, so the
+    per-request framework overhead is paid once for the whole batch. Large
+    batches are computed in the threadpool so they don't block the event loop;
+    single readings take about a microsecond and are computed inline.
+    """
+    data = await _parse_body(request, _BATCH_REQUEST)
+    if len(data.temperature) >= _BATCH_THREADPOOL_THRESHOLD:
+        abs_humidity = await run_in_threadpool(calculate_absolute_humidity_batch, data.temperature, data.humidity)
+    else:
+        abs_humidity = calculate_absolute_humidity_batch(data.temperature, data.humidity)
+
+    return _json_response({"absolute_humidity": abs_humidity.tolist(), "unit": _UNIT})
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
@@ -86,12 +248,10 @@ async def health_check():
     Health check endpoint for API monitoring.
 
     Returns a simple status response to indicate the API is running
-    and responding to requests.
+    and responding to requests. The body is serialized once at import,
+    since load balancers may poll this endpoint frequently.
 
     Returns:
         HealthResponse: Status indicating API health
     """
-    return HealthResponse(status="healthy")
-
-
-# Info endpoint removed to simplify API
+    return Response(content=_HEALTH_BODY, media_type="application/json", headers=_HEALTH_HEADERS)
@@ -5,14 +5,95 @@ This module contains the main web interface route that serves the HTML page
 using Jinja2 templates.
 """
 
-from fastapi import APIRouter, Request
+import hashlib
+from types import MappingProxyType
+
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from ..config import config
 
-# Initialize Jinja2 templates
+# Initialize Jinja2 templates. Pages are rendered once at import, so there is
+# nothing for Jinja to reload: skip its per-lookup template mtime checks
 templates = Jinja2Templates(directory=str(config.TEMPLATES_DIR))
+templates.env.auto_reload = False
+# Compiled template code is shared on disk, so other workers and restarts skip compilation
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+# Values every page uses are Jinja globals, set once on the shared environment
+templates.env.globals.update(
+    api_base_url=config.API_PREFIX,
+    app_name=config.APP_NAME,
+    app_version=config.APP_VERSION,
+    app_description=config.APP_DESCRIPTION,
+)
+
+# Page contexts only depend on configuration, so they are built once (read-only)
+_INDEX_CONTEXT = MappingProxyType(
+    {
+        "title": config.APP_NAME,
+        "active_page": "home",
+    }
+)
+_ABOUT_CONTEXT = MappingProxyType(
+    {
+        "title": f"About - {config.APP_NAME}",
+        "active_page": "about",
+        "limits": MappingProxyType(
+            {
+                "temperature_min": "-100",
+                "temperature_max": "100",
+                "humidity_min": "0",
+                "humidity_max": "100",
+            }
+        ),
+    }
+)
+
+# Neither page depends on the request, so both are rendered once, at import
+_INDEX_HTML = templates.get_template("index.html").render(**_INDEX_CONTEXT).encode()
+_ABOUT_HTML = templates.get_template("about.html").render(**_ABOUT_CONTEXT).encode()
+
+
+def _etag(body: bytes) -> str:
+    """
+    Weak ETag for a pre-rendered page, derived from its content.
+
+    Weak because GZipMiddleware serves the same page in gzip and identity
+    encodings, which are not byte-for-byte identical.
+    """
+    return f'W/"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weak indicator, for weak comparison (RFC 9110, section 8.8.3.2)."""
+    return etag.removeprefix("W/")
+
+
+_INDEX_ETAG = _etag(_INDEX_HTML)
+_ABOUT_ETAG = _etag(_ABOUT_HTML)
+_CACHE_CONTROL = f"public, max-age={config.PAGE_CACHE_MAX_AGE}"
+
+
+def _page_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Serve a pre-rendered page with caching headers.
+
+    Browsers revalidate with If-None-Match once max-age runs out; a matching
+    ETag gets an empty 304 instead of the page. If-None-Match uses weak
+    comparison, so a tag with or without the W/ prefix matches.
+    """
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or _opaque_tag(etag) in (_opaque_tag(tag.strip()) for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
+
 
 # Create web router
 router = APIRouter(
@@ -38,17 +119,7 @@ router = APIRouter(
 )
 async def index(request: Request):
     """Serve the main calculator web interface."""
-    return templates.TemplateResponse(
-        request=request,
-        name="index.html",
-        context={
-            "title": config.APP_NAME,
-            "api_base_url": config.API_PREFIX,
-            "app_version": config.APP_VERSION,
-            "app_description": config.APP_DESCRIPTION,
-            "active_page": "home",
-        },
-    )
+    return _page_response(request, _INDEX_HTML, _INDEX_ETAG)
 
 
 @router.get(
@@ -65,21 +136,4 @@ async def index(request: Request):
 )
 async def about(request: Request):
     """Serve the about page describing how the calculation works."""
-    return templates.TemplateResponse(
-        request=request,
-        name="about.html",
-        context={
-            "title": f"About - {config.APP_NAME}",
-            "api_base_url": config.API_PREFIX,
-            "app_name": config.APP_NAME,
-            "app_version": config.APP_VERSION,
-            "app_description": config.APP_DESCRIPTION,
-            "active_page": "about",
-            "limits": {
-                "temperature_min": "-100",
-                "temperature_max": "100",
-                "humidity_min": "0",
-                "humidity_max": "100",
-            },
-        },
-    )
+    return _page_response(request, _ABOUT_HTML, _ABOUT_ETAG)
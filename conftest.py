@@ -0,0 +1,28 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Create a test client for the FastAPI app.
+
+    Shared by the whole session, so the app's lifespan (kernel warm-up and
+    cache prewarming) runs once rather than for every test.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(client):
+    """Fetch the generated OpenAPI schema once for all the tests that inspect it."""
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    return response.json()
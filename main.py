@@ -16,18 +16,44 @@ from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
+from pydantic_core import to_json
 
 from app import config
+from app.psychro_calculations import warm_up
 from app.routes import api_router, web_router
 
 logger = logging.getLogger(__name__)
 
+# The generic 500 body never changes, so serialize it once
+_INTERNAL_ERROR_BODY = to_json({"error": "Internal server error"})
+
+
+async def value_error_handler(request: Request, exc: ValueError) -> Response:
+    """Return invalid calculation inputs as 400 responses."""
+    return Response(to_json({"error": f"Invalid input: {exc}"}), status_code=400, media_type="application/json")
+
+
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
+    """Log unexpected errors and return a generic 500 response."""
+    logger.exception("Unhandled error processing %s", request.url.path)
+    return Response(_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
+
+
+# Starlette runs the Exception handler from its outermost (server error) middleware
+# and re-raises afterwards, so expected errors keep their own handler
+_EXCEPTION_HANDLERS = {
+    ValueError: value_error_handler,
+    Exception: general_exception_handler,
+}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Log startup/shutdown around the application lifetime."""
+    """Warm up the calculation kernels and log startup/shutdown around the application lifetime."""
+    warm_up()
     logger.info("%s v%s starting on http://%s:%s", config.APP_NAME, config.APP_VERSION, config.HOST, config.PORT)
     yield
     logger.info("Server shutting down")
@@ -35,7 +61,7 @@ async def lifespan(app: FastAPI):
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
-    app = FastAPI(lifespan=lifespan, **config.get_fastapi_config())
+    app = FastAPI(lifespan=lifespan, exception_handlers=_EXCEPTION_HANDLERS, **config.get_fastapi_config())
 
     app.add_middleware(
         CORSMiddleware,
@@ -43,24 +69,19 @@ def create_app() -> FastAPI:
         allow_methods=config.ALLOW_METHODS,
         allow_headers=config.ALLOW_HEADERS,
     )
+    # Compresses the HTML pages and large batch responses; small JSON bodies stay uncompressed
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=config.GZIP_MINIMUM_SIZE,
+        compresslevel=config.GZIP_COMPRESS_LEVEL,
+    )
 
-    if config.STATIC_DIR.exists():
+    if config.STATIC_DIR_EXISTS:
         app.mount("/static", StaticFiles(directory=str(config.STATIC_DIR)), name="static")
 
     app.include_router(web_router)
     app.include_router(api_router)
 
-    @app.exception_handler(ValueError)
-    async def value_error_handler(request: Request, exc: ValueError):
-        """Return invalid calculation inputs as 400 responses."""
-        return JSONResponse(status_code=400, content={"error": f"Invalid input: {exc}"})
-
-    @app.exception_handler(Exception)
-    async def general_exception_handler(request: Request, exc: Exception):
-        """Log unexpected errors and return a generic 500 response."""
-        logger.exception("Unhandled error processing %s", request.url.path)
-        return JSONResponse(status_code=500, content={"error": "Internal server error"})
-
     return app
 
 
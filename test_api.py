@@ -4,16 +4,10 @@ Simplified pytest test suite for FastAPI application core functionality.
 """
 
 import pytest
-from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
-from main import app
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    with TestClient(app) as test_client:
-        yield test_client
+from app.models import HumidityCalculationRequest
+from app.routes import api
 
 
 class TestHealthEndpoint:
@@ -26,6 +20,7 @@ class TestHealthEndpoint:
 
         data = response.json()
         assert data == {"status": "healthy"}
+        assert response.headers["cache-control"] == "no-cache"
 
 
 class TestWebInterface:
@@ -36,10 +31,49 @@ class TestWebInterface:
         response = client.get("/")
         assert response.status_code == 200
 
-        content = response.text
-        assert "Absolute Humidity Calculator" in content
-        assert "Temperature" in content
-        assert "Humidity" in content
+        content = response.content
+        assert b"Absolute Humidity Calculator" in content
+        assert b"Temperature" in content
+        assert b"Humidity" in content
+
+    @pytest.mark.parametrize("path", ["/", "/about"])
+    def test_pages_are_compressed(self, client, path):
+        """Test that HTML pages are gzip-compressed for clients that accept it."""
+        response = client.get(path, headers={"accept-encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+
+    @pytest.mark.parametrize("path", ["/", "/about"])
+    def test_pages_revalidate_with_etag(self, client, path):
+        """Test that pages carry a weak ETag and a matching If-None-Match gets a 304."""
+        response = client.get(path)
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        assert response.headers["cache-control"].startswith("public, max-age=")
+
+        revalidated = client.get(path, headers={"if-none-match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+
+        stale = client.get(path, headers={"if-none-match": '"stale"'})
+        assert stale.status_code == 200
+
+    @pytest.mark.parametrize(
+        "if_none_match",
+        [
+            pytest.param("{etag}", id="weak"),
+            pytest.param("{opaque}", id="strong-form"),
+            pytest.param('"stale", {etag}', id="list"),
+            pytest.param("*", id="any"),
+        ],
+    )
+    def test_etag_uses_weak_comparison(self, client, if_none_match):
+        """Test that If-None-Match matches with or without the W/ prefix, in lists and as *."""
+        etag = client.get("/").headers["etag"]
+        header = if_none_match.format(etag=etag, opaque=etag.removeprefix("W/"))
+
+        assert client.get("/", headers={"if-none-match": header}).status_code == 304
 
 
 class TestCalculationEndpoint:
@@ -87,33 +121,184 @@ class TestCalculationEndpoint:
             f"Expected {min_expected}-{max_expected}, got {abs_humidity} for {temp}°C, {humidity}% RH"
         )
 
+    @pytest.mark.parametrize(
+        "body",
+        [
+            pytest.param(b'{"humidity": 50}', id="missing-temperature"),
+            pytest.param(b"not json", id="malformed"),
+            pytest.param(b"", id="empty"),
+        ],
+    )
+    def test_invalid_body(self, client, body):
+        """Test that invalid or malformed bodies are reported as validation errors."""
+        response = client.post("/api/calculate", content=body, headers={"content-type": "application/json"})
 
-class TestResponseFormat:
-    """Test the format of API responses."""
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][0] == "body"
 
-    def test_successful_response_structure(self, client):
-        """Test that successful responses have the correct structure."""
-        data = {"temperature": 25.0, "humidity": 60}
-        response = client.post("/api/calculate", json=data)
+    @pytest.mark.parametrize("path", ["/api/calculate", "/api/calculate_batch"])
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            pytest.param({"content-type": "text/plain"}, id="text-plain"),
+            pytest.param({"content-type": "application/x-www-form-urlencoded"}, id="form"),
+            pytest.param({}, id="missing"),
+        ],
+    )
+    def test_non_json_content_type_rejected(self, client, path, headers):
+        """Test that valid JSON sent without a JSON content type is rejected."""
+        body = b'{"temperature": 25.0, "humidity": 50}'
+        if path.endswith("_batch"):
+            body = b'{"temperature": [25.0], "humidity": [50]}'
+        response = client.post(path, content=body, headers=headers)
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body"]
+
+    @pytest.mark.parametrize("content_type", ["application/json; charset=utf-8", "application/vnd.api+json"])
+    def test_json_content_type_variants_accepted(self, client, content_type):
+        """Test that JSON media types with parameters or a +json suffix are accepted."""
+        response = client.post(
+            "/api/calculate",
+            content=b'{"temperature": 25.0, "humidity": 50}',
+            headers={"content-type": content_type},
+        )
 
         assert response.status_code == 200
-        result = response.json()
 
-        # Check all required fields are present
-        required_fields = ["absolute_humidity", "temperature", "humidity", "unit"]
-        for field in required_fields:
-            assert field in result, f"Missing field: {field}"
+    def test_repeated_body_served_from_cache(self, client):
+        """Test that an identical request body is answered from the response cache."""
+        api._cached_calculation_response.cache_clear()
+        first = client.post("/api/calculate", json={"temperature": 21.5, "humidity": 40})
+        second = client.post("/api/calculate", json={"temperature": 21.5, "humidity": 40})
+
+        assert first.content == second.content
+        assert api._cached_calculation_response.cache_info().hits == 1
 
-        # Check unit is correct
+    def test_calculation_error_returns_400(self, client, monkeypatch):
+        """Test that a ValueError from the calculation is reported as a 400."""
+
+        def failing_calculation(temperature, humidity):
+            raise ValueError("out of range")
+
+        monkeypatch.setattr(api, "calculate_absolute_humidity_unchecked", failing_calculation)
+        api._cached_calculation_response.cache_clear()
+        response = client.post("/api/calculate", json={"temperature": 25.0, "humidity": 60})
+
+        assert response.status_code == 400
+        assert response.json() == {"error": "Invalid input: out of range"}
+
+
+class TestCalculationRequestValidation:
+    """Test request validation directly on the model, without the HTTP round-trip."""
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            pytest.param(b'{"humidity": 50}', id="missing-temperature"),
+            pytest.param(b'{"temperature": 25}', id="missing-humidity"),
+            pytest.param(b"{}", id="empty-object"),
+            pytest.param(b'{"temperature": 25, "humidity": 101}', id="humidity-above-range"),
+            pytest.param(b'{"temperature": -101, "humidity": 50}', id="temperature-below-range"),
+            pytest.param(b'{"temperature": 25, "humidity": 50.5}', id="fractional-humidity"),
+            pytest.param(b'{"temperature": "warm", "humidity": 50}', id="non-numeric-temperature"),
+            pytest.param(b"[25, 50]", id="array"),
+            pytest.param(b"not json", id="malformed"),
+        ],
+    )
+    def test_invalid_body(self, body):
+        """Test that invalid bodies are rejected by the request model."""
+        with pytest.raises(ValidationError):
+            HumidityCalculationRequest.model_validate_json(body)
+
+
+class TestBatchCalculationEndpoint:
+    """Test the batch calculation API endpoint."""
+
+    def test_batch_matches_single_calculations(self, client):
+        """Test that batch results match the single-reading endpoint, in order."""
+        temperatures = [20.0, 30.0, 0.0, -10.5, 22.28884329018546]
+        humidities = [50, 80, 30, 100, 26]
+        response = client.post("/api/calculate_batch", json={"temperature": temperatures, "humidity": humidities})
+
+        assert response.status_code == 200
+        result = response.json()
         assert result["unit"] == "g/m³"
 
+        for temp, humidity, abs_humidity in zip(temperatures, humidities, result["absolute_humidity"], strict=True):
+            single = client.post("/api/calculate", json={"temperature": temp, "humidity": humidity}).json()
+            assert abs_humidity == single["absolute_humidity"]
+
+    def test_large_batch_is_compressed(self, client):
+        """Test that large batch responses are gzip-compressed."""
+        data = {"temperature": [20.0] * 200, "humidity": [50] * 200}
+        response = client.post("/api/calculate_batch", json=data, headers={"accept-encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["absolute_humidity"]) == 200
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"temperature": [20.0, 25.0], "humidity": [50]},
+            {"temperature": [], "humidity": []},
+            {"temperature": [20.0], "humidity": [101]},
+            {"temperature": [150.0], "humidity": [50]},
+        ],
+    )
+    def test_invalid_batch(self, client, data):
+        """Test that mismatched, empty or out-of-range batches are rejected."""
+        response = client.post("/api/calculate_batch", json=data)
+        assert response.status_code == 422
+
+
+class TestOpenAPI:
+    """Test the generated OpenAPI schema."""
+
+    @pytest.mark.parametrize(
+        "path,model",
+        [("/api/calculate", "HumidityCalculationRequest"), ("/api/calculate_batch", "HumidityBatchRequest")],
+    )
+    def test_request_body_documented(self, openapi_schema, path, model):
+        """Test that handlers reading the raw body still document their request schema."""
+        request_body = openapi_schema["paths"][path]["post"]["requestBody"]
+
+        assert request_body["required"] is True
+        assert request_body["content"]["application/json"]["schema"]["title"] == model
+
+    @pytest.mark.parametrize(
+        "path,method,model",
+        [
+            ("/api/calculate", "post", "HumidityCalculationResponse"),
+            ("/api/calculate_batch", "post", "HumidityBatchResponse"),
+            ("/api/health", "get", "HealthResponse"),
+        ],
+    )
+    def test_response_model_documented(self, openapi_schema, path, method, model):
+        """Test that responses returned as raw bytes still document their response model."""
+        schema = openapi_schema["paths"][path][method]["responses"]["200"]["content"]["application/json"]["schema"]
+
+        assert schema["$ref"].endswith(f"/{model}")
+
 
 class TestHttpMethods:
     """Test HTTP method restrictions."""
 
-    def test_get_not_allowed_on_calculate(self, client):
-        """Test that GET is not allowed on calculate endpoint."""
-        response = client.get("/api/calculate")
+    @pytest.mark.parametrize(
+        "method,path",
+        [
+            ("GET", "/api/calculate"),
+            ("PUT", "/api/calculate"),
+            ("DELETE", "/api/calculate"),
+            ("HEAD", "/api/calculate"),
+            ("GET", "/api/calculate_batch"),
+            ("POST", "/api/health"),
+        ],
+    )
+    def test_method_not_allowed(self, client, method, path):
+        """Test that endpoints reject methods they don't serve."""
+        response = client.request(method, path)
         assert response.status_code == 405  # Method Not Allowed
 
 
@@ -4,9 +4,38 @@ Focused pytest test suite for absolute humidity calculations.
 Tests for core functionality only.
 """
 
+import numpy as np
+import psychrolib
 import pytest
 
-from app.psychro_calculations import calculate_absolute_humidity
+from app.psychro_calculations import (
+    _ah_batch_kernel,
+    _ah_kernel,
+    _ah_vec,
+    _cached_absolute_humidity,
+    _sat_vap_pres,
+    calculate_absolute_humidity,
+    calculate_absolute_humidity_batch,
+    calculate_absolute_humidity_unchecked,
+    prewarm_cache,
+)
+
+psychrolib.SetUnitSystem(psychrolib.SI)
+
+# Unrounded results are compared with PsychroLib at this relative tolerance, well
+# above the error of the saturation pressure fits (about 1e-9 relative)
+PSYCHROLIB_RTOL = 1e-7
+
+
+def _psychrolib_absolute_humidity(temperature, humidity):
+    """
+    Reference absolute humidity from PsychroLib, in g/m³ (not rounded).
+
+    PsychroLib compiles its own functions with numba when it is installed, so
+    the reference runs natively after the first call.
+    """
+    hum_ratio = psychrolib.GetHumRatioFromRelHum(temperature, humidity / 100.0, 101325)
+    return psychrolib.GetMoistAirDensity(temperature, hum_ratio, 101325) * hum_ratio * 1000
 
 
 class TestCalculation:
@@ -29,6 +58,103 @@ class TestCalculation:
             f"Expected {min_expected}-{max_expected}, got {result} for {temp}°C, {humidity}% RH"
         )
 
+    def test_matches_psychrolib(self):
+        """Test that the inlined kernel agrees with PsychroLib, including around the triple point."""
+        temps, humidities = np.meshgrid([-40.0, -0.5, 0.0, 0.01, 0.02, 20.0, 37.5, 60.0, 100.0], [0, 1, 50, 100])
+        temps, humidities = temps.ravel().tolist(), humidities.ravel().tolist()
+
+        results = [_ah_kernel(t, h / 100.0) for t, h in zip(temps, humidities, strict=True)]
+        expected = [_psychrolib_absolute_humidity(t, h) for t, h in zip(temps, humidities, strict=True)]
+
+        np.testing.assert_allclose(results, expected, rtol=PSYCHROLIB_RTOL)
+
+    # Readings whose results are far from a rounding tie, so the rounded values must match exactly
+    @pytest.mark.parametrize("temp,humidity", [(-40.0, 50), (0.0, 30), (0.02, 100), (20.0, 50), (30.0, 80), (60.0, 50)])
+    def test_rounded_result_matches_psychrolib(self, temp, humidity):
+        """Test that the rounded result equals PsychroLib's rounded to 2 decimals."""
+        assert calculate_absolute_humidity(temp, humidity) == round(_psychrolib_absolute_humidity(temp, humidity), 2)
+
+    @pytest.mark.parametrize(
+        "temp,humidity",
+        [(-100.1, 50), (200.1, 50), (20.0, -1), (20.0, 101), (float("nan"), 50), (float("inf"), 50)],
+    )
+    def test_out_of_range_inputs(self, temp, humidity):
+        """Test that inputs outside the supported range raise ValueError."""
+        with pytest.raises(ValueError):
+            calculate_absolute_humidity(temp, humidity)
+
+    def test_saturation_pressure_fit_matches_psychrolib(self):
+        """Test that the fitted saturation pressure stays within 1e-3 Pa of PsychroLib on -40..60°C."""
+        temps = np.linspace(-40.0, 60.0, 20001)
+        errors = [abs(_sat_vap_pres(t) - psychrolib.GetSatVapPres(t)) for t in temps]
+
+        assert max(errors) < 1e-3
+
+    @pytest.mark.parametrize("temp,humidity", [(22.28884329018546, 26), (-12.3456, 80), (31.005, 47)])
+    def test_fine_temperatures_not_rounded(self, temp, humidity):
+        """Test that temperatures with more than 2 decimals are computed as given, not at 0.01°C."""
+        expected = round(_psychrolib_absolute_humidity(temp, humidity), 2)
+
+        assert calculate_absolute_humidity(temp, humidity) == expected
+        assert calculate_absolute_humidity_unchecked(temp, humidity) == expected
+        assert calculate_absolute_humidity_batch([temp], [humidity]).tolist() == [expected]
+
+    def test_unchecked_matches_checked(self):
+        """Test that the unchecked entry point used by the API gives the same results."""
+        assert calculate_absolute_humidity_unchecked(25.5, 60) == calculate_absolute_humidity(25.5, 60)
+
+    def test_prewarmed_readings_are_cached(self):
+        """Test that prewarmed readings are served from the cache."""
+        prewarm_cache(20, 21)
+        hits = _cached_absolute_humidity.cache_info().hits
+
+        calculate_absolute_humidity(20.0, 55)
+
+        assert _cached_absolute_humidity.cache_info().hits == hits + 1
+
+
+class TestBatchCalculation:
+    """Test the vectorized batch calculation function."""
+
+    def test_matches_scalar_calculation(self):
+        """Test that the vectorized path gives the same rounded results as the scalar one."""
+        temps = [t / 4 for t in range(-400, 401)]
+        humidities = [(i * 7) % 101 for i in range(len(temps))]
+
+        results = calculate_absolute_humidity_batch(temps, humidities)
+
+        assert results.tolist() == [calculate_absolute_humidity(t, h) for t, h in zip(temps, humidities, strict=True)]
+
+    def test_matches_psychrolib_grid(self):
+        """Test the whole supported range against PsychroLib in a single batch call."""
+        temps, humidities = np.meshgrid(np.arange(-100.0, 100.01, 0.73), np.arange(0, 101, 4))
+        temps, humidities = temps.ravel(), humidities.ravel()
+
+        expected = [
+            _psychrolib_absolute_humidity(temp, humidity)
+            for temp, humidity in zip(temps.tolist(), humidities.tolist(), strict=True)
+        ]
+
+        np.testing.assert_allclose(_ah_batch_kernel(temps, humidities / 100.0), expected, rtol=PSYCHROLIB_RTOL)
+
+    @pytest.mark.skipif(_ah_batch_kernel is _ah_vec, reason="the NumPy fallback is the batch kernel without numba")
+    def test_numpy_fallback_matches_batch_kernel(self):
+        """Test that the NumPy fallback used without numba agrees with the compiled batch kernel."""
+        temps = np.linspace(-100.0, 200.0, 3001)
+        rh = np.linspace(0.0, 1.0, 3001)
+
+        # The compiled kernel uses the saturation pressure fits (about 1e-9 relative error) on -40..60°C
+        np.testing.assert_allclose(_ah_vec(temps, rh), _ah_batch_kernel(temps, rh), rtol=1e-7)
+
+    @pytest.mark.parametrize(
+        "temps,humidities",
+        [([20.0, 25.0], [50]), ([-100.1], [50]), ([20.0], [101]), ([float("nan")], [50])],
+    )
+    def test_invalid_inputs(self, temps, humidities):
+        """Test that mismatched or out-of-range inputs raise ValueError."""
+        with pytest.raises(ValueError):
+            calculate_absolute_humidity_batch(temps, humidities)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])